@@ -390,11 +390,11 @@ class Backtest:
 
     @property
     def base(self) -> Base:
-        return tuple(self.__bases.values())[0]
+        return next(iter(self.__bases.values()))
 
     @property
     def hbase(self) -> Base:
-        return tuple(self.__bases.values())[-1]
+        return next(reversed(self.__bases.values()))
 
     @property
     def bases(self) -> Dict[str, Base]:
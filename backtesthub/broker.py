@@ -6,14 +6,13 @@ import pandas as pd
 from numbers import Number
 from datetime import date
 from collections import defaultdict as ddict
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 
 from .order import Order
 from .position import Position
 
 from .utils.bases import Line, Base, Asset
 from .utils.config import (
-    _DEFAULT_CURRENCY,
     _DEFAULT_SMOOTH,
     _DEFAULT_BUFFER,
     _DEFAULT_CRATE,
@@ -117,6 +116,7 @@ class Broker:
         self.__cancels: List[Order] = []
         self.__executed: List[Order] = []
         self.__currs: Dict[str, Base] = {}
+        self.__fx: Dict[str, Optional[Line]] = {}
 
         self.__cash = np.ones(self.__length) * cash
         self.__open = np.ones(self.__length) * cash
@@ -200,6 +200,27 @@ class Broker:
                 },
             )
 
+    def new_orders(
+        self,
+        datas: Iterable[Asset],
+        sizes: Iterable[Number],
+        limit: Optional[Number] = None,
+        stop: Optional[Number] = None,
+    ):
+        """
+        `Batch Order Creation Method`
+
+        Same as `new_order`, but for a sequence of
+        assets and their respective sizes, e.g. all
+        orders issued by a strategy in one period.
+
+        """
+
+        new_order = self.new_order
+
+        for data, size in zip(datas, sizes):
+            new_order(data, size, limit, stop)
+
     def close(self, data: Asset):
         ticker = data.ticker
         if not ticker in self.__positions:
@@ -247,12 +268,12 @@ class Broker:
             data = pos.data
             ticker = data.ticker
             factor = data.multiplier
-            curr = data.currency
-            if not curr == _DEFAULT_CURRENCY:
-                pair = f"{curr}{_DEFAULT_CURRENCY}"
-                factor *= self.__currs[pair].close[0]
+            fx = self.get_fx(data)
+            if fx is not None:
+                factor *= fx[0]
 
-            MTM = pos.size * (data.open[0] - data.close[-1]) * factor
+            open, close = data.get_value("open"), data.get_value("close", -1)
+            MTM = pos.size * (open - close) * factor
 
             self.__open[self.__buffer] += MTM
             self.__equity[self.__buffer] += MTM
@@ -263,7 +284,7 @@ class Broker:
             ## When cash is consumed, it cannot yield carry ##
             ## Rateslike assets are swap-like against carry ##
             if data.cashlike:
-                dollar_expo = pos.size * factor * data.close[-1]
+                dollar_expo = pos.size * factor * close
                 carry = -dollar_expo * self.last_carry
                 self.__open[self.__buffer] += carry
                 self.__equity[self.__buffer] += carry
@@ -311,10 +332,9 @@ class Broker:
         ticker = data.ticker
 
         factor = data.multiplier
-        curr = data.currency
-        if not curr == _DEFAULT_CURRENCY:
-            pair = f"{curr}{_DEFAULT_CURRENCY}"
-            factor *= self.__currs[pair].close[0]
+        fx = self.get_fx(data)
+        if fx is not None:
+            factor *= fx[0]
 
         total_comm = order.total_comm
         self.__tpnl[ticker] += total_comm
@@ -325,7 +345,7 @@ class Broker:
 
         self.__cash[self.__buffer] += CASH
 
-        M2M = order.size * (data.open[0] - exec_price) * factor
+        M2M = order.size * (data.get_value("open") - exec_price) * factor
         self.__open[self.__buffer] += M2M
         self.__equity[self.__buffer] += M2M
         self.__tpnl[ticker] += M2M
@@ -430,13 +450,12 @@ class Broker:
             data, ticker = pos.data, pos.ticker
             size, factor = pos.size, data.multiplier
 
-            curr = data.currency
-            if not curr == _DEFAULT_CURRENCY:
-                pair = f"{curr}{_DEFAULT_CURRENCY}"
-                factor *= self.__currs[pair].close[0]
+            fx = self.get_fx(data)
+            if fx is not None:
+                factor *= fx[0]
 
             order = self.__orders.get(ticker)
-            price, open = data.close[0], data.open[0]
+            price, open = data.get_value("close"), data.get_value("open")
 
             if order:
                 target = size + order.size
@@ -471,8 +490,8 @@ class Broker:
                         "tpnl": self.__tpnl[ticker],
                         "cpnl": self.__cpnl[ticker],
                         "pnl": self.__pnl[ticker],
-                        "sign": data.signal[0],
-                        "refVol": data.volatility[0],
+                        "sign": data.get_value("signal"),
+                        "refVol": data.get_value("volatility"),
                         "target": target,
                         "texpo": texpo,
                         "equity": self.curr_equity,
@@ -490,8 +509,8 @@ class Broker:
                         "tpnl": self.__tpnl[ticker],
                         "cpnl": self.__cpnl[ticker],
                         "pnl": self.__pnl[ticker],
-                        "sign": -data.signal[0],
-                        "refVol": data.volatility[0],
+                        "sign": -data.get_value("signal"),
+                        "refVol": data.get_value("volatility"),
                         "target": -target,
                         "texpo": texpo,
                         "equity": self.curr_equity,
@@ -526,6 +545,22 @@ class Broker:
     def get_orders(self, ticker: str) -> Optional[Position]:
         return self.__orders.get(ticker)
 
+    def get_fx(self, data: Asset) -> Optional[Line]:
+        """
+        Closing FX line that converts `data`'s currency
+        into `_DEFAULT_CURRENCY` (None if they're equal).
+        It is resolved once per asset and reused, by
+        both the broker and the strategies' sizing.
+        """
+        ticker = data.ticker
+        if ticker not in self.__fx:
+            pair, fx = data.pair, None
+            if pair is not None:
+                fx = self.__currs[pair].close
+            self.__fx[ticker] = fx
+
+        return self.__fx[ticker]
+
     def get_expo(self) -> Number:
         """
         Get Current Exposition (% Equity)
@@ -534,15 +569,13 @@ class Broker:
         expo = 0
 
         for pos in self.position_stack:
-            data, ticker = pos.data, pos.ticker
-            size, factor = pos.size, data.multiplier
+            notional = pos.expo
 
-            curr = data.currency
-            if not curr == _DEFAULT_CURRENCY:
-                pair = f"{curr}{_DEFAULT_CURRENCY}"
-                factor *= self.__currs[pair].close[0]
+            fx = self.get_fx(pos.data)
+            if fx is not None:
+                notional *= fx[0]
 
-            expo += size * factor * data.close[0] / self.curr_equity
+            expo += notional / self.curr_equity
 
         return expo
 
@@ -557,10 +590,9 @@ class Broker:
             data, ticker = pos.data, pos.ticker
             size, factor = pos.size, data.multiplier
 
-            curr = data.currency
-            if not curr == _DEFAULT_CURRENCY:
-                pair = f"{curr}{_DEFAULT_CURRENCY}"
-                factor *= self.__currs[pair].close[0]
+            fx = self.get_fx(data)
+            if fx is not None:
+                factor *= fx[0]
 
             order = self.__orders.get(ticker)
 
@@ -569,7 +601,7 @@ class Broker:
             else:
                 target = size
 
-            texpo += target * factor * data.close[0] / self.curr_equity
+            texpo += target * factor * data.get_value("close") / self.curr_equity
 
         return texpo
 
@@ -588,15 +620,13 @@ class Broker:
             raise ValueError(txt)
 
         for pos in self.position_stack:
-            data, ticker = pos.data, pos.ticker
-            size, factor = pos.size, data.multiplier
+            data, notional = pos.data, pos.expo
 
-            curr = data.currency
-            if not curr == _DEFAULT_CURRENCY:
-                pair = f"{curr}{_DEFAULT_CURRENCY}"
-                factor *= self.__currs[pair].close[0]
+            fx = self.get_fx(data)
+            if fx is not None:
+                notional *= fx[0]
 
-            if "beta" not in data.lines:
+            if "beta" not in data:
                 df = pd.DataFrame.from_records(
                     {
                         "close": data.close.array,
@@ -613,7 +643,7 @@ class Broker:
 
                 data.add_line("beta", Line(df.beta, buffer=data.buffer))
 
-            beta += data.beta[0] * size * factor * data.close[0] / self.curr_equity
+            beta += data.get_value("beta") * notional / self.curr_equity
 
         return beta
 
@@ -635,10 +665,9 @@ class Broker:
             data, ticker = pos.data, pos.ticker
             size, factor = pos.size, data.multiplier
 
-            curr = data.currency
-            if not curr == _DEFAULT_CURRENCY:
-                pair = f"{curr}{_DEFAULT_CURRENCY}"
-                factor *= self.__currs[pair].close[0]
+            fx = self.get_fx(data)
+            if fx is not None:
+                factor *= fx[0]
 
             order = self.__orders.get(ticker)
 
@@ -647,7 +676,7 @@ class Broker:
             else:
                 target = size
 
-            if "beta" not in data.lines:
+            if "beta" not in data:
                 df = pd.DataFrame.from_records(
                     {
                         "close": data.close.array,
@@ -664,7 +693,9 @@ class Broker:
 
                 data.add_line("beta", Line(df.beta, buffer=data.buffer))
 
-            beta += data.beta[0] * target * factor * data.close[0] / self.curr_equity
+            beta += (
+                data.get_value("beta") * target * factor * data.get_value("close")
+            ) / self.curr_equity
 
         return beta
 
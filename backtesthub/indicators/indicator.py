@@ -44,7 +44,7 @@ def SMACross(
     p1: int,
     p2: int,
     *args,
-) -> pd.Series:
+) -> np.ndarray:
     """
     `Simple Moving Average (SMA) Cross`
     """
@@ -52,7 +52,9 @@ def SMACross(
     sma1 = pd.Series(data.close).rolling(p1).mean()
     sma2 = pd.Series(data.close).rolling(p2).mean()
 
-    return np.sign(sma1 - sma2)
+    cross = sma1.to_numpy() - sma2.to_numpy()
+
+    return np.sign(cross, out=cross)
 
 
 def SMARatio(
@@ -76,7 +78,7 @@ def EMACross(
     p1: int,
     p2: int,
     *args,
-) -> pd.Series:
+) -> np.ndarray:
     """
     `Exponential Moving Average (EMA) Cross`
     """
@@ -84,7 +86,9 @@ def EMACross(
     ema1 = pd.Series(data.close).ewm(span=p1).mean()
     ema2 = pd.Series(data.close).ewm(span=p2).mean()
 
-    return np.sign(ema1 - ema2)
+    cross = ema1.to_numpy() - ema2.to_numpy()
+
+    return np.sign(cross, out=cross)
 
 
 def KAMACross(
@@ -96,7 +100,7 @@ def KAMACross(
     s1: int = 30,
     s2: int = 30,
     *args,
-) -> pd.Series:
+) -> np.ndarray:
     """
     `Kaufmann's Adaptive Moving Average (KAMA) Cross`
 
@@ -112,7 +116,9 @@ def KAMACross(
     kama1 = KAMA(close, window=p1, pow1=f1, pow2=s1)
     kama2 = KAMA(close, window=p2, pow1=f2, pow2=s2)
 
-    return np.sign(kama1._kama - kama2._kama)
+    cross = kama1._kama - kama2._kama
+
+    return np.sign(cross, out=cross)
 
 
 def BBANDSCross(
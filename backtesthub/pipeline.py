@@ -44,7 +44,7 @@ class Pipeline(metaclass=ABCMeta):
         self.__hedges = hedges
         self.__holidays = holidays
 
-        self.__universe = []
+        self.universe: Sequence[Asset] = ()
 
     @abstractmethod
     def init(self):
@@ -136,11 +136,11 @@ class Pipeline(metaclass=ABCMeta):
 
     @property
     def asset(self) -> Asset:
-        return tuple(self.__assets.values())[0]
+        return next(iter(self.__assets.values()))
 
     @property
     def hedge(self) -> Asset:
-        return tuple(self.__hedges.values())[0]
+        return next(iter(self.__hedges.values()))
 
     @property
     def main(self) -> Line:
@@ -1,7 +1,8 @@
 #! /usr/bin/env python3
 
 import numpy as np
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
+from itertools import compress
 from datetime import date
 
 from ..pipeline import Pipeline
@@ -38,7 +39,7 @@ class Rolling(Pipeline):
     i.e., it assumes the closest to maturity contract will always be
     the active - and the one we're interested in trading. 
 
-    It returns as the universe a [list of] single asset, and does the 
+    It returns as the universe a [tuple of] single asset, and does the 
     job of monitoring the rolling date, in order to update the universe
     and close positions in older contracts. 
 
@@ -53,24 +54,43 @@ class Rolling(Pipeline):
     """
 
     def init(self):
-        self.build_chain(), self.apply_roll()
-        self.universe = []
+        self.build_chain()
+        self.maturities = np.array(
+            [asset.maturity.toordinal() for asset in self.chain]
+        )
+        self.apply_roll()
+        self.universe = ()
 
     def next(self) -> Sequence[Asset]:
 
-        while self.get_lagged_date() > self.maturity:
+        lagged = self.get_lagged_date()
+
+        if lagged > self.maturity:
             self.broker.close(self.curr)
-            self.apply_roll()
+            self.apply_roll(lagged)
 
         return self.universe
 
-    def apply_roll(self):
+    def apply_roll(self, lagged: Optional[date] = None):
+        """
+        Pops the next contract out of the chain. When `lagged` is
+        given, every contract that has already expired by then is
+        skipped at once, through a binary search on the maturities
+        of the (descending) chain, instead of rolling one by one.
+        """
+
+        if lagged is not None and self.chain:
+            size = len(self.chain)
+            ascending = self.maturities[size - 1 :: -1]
+            expired = np.searchsorted(ascending, lagged.toordinal())
+            del self.chain[size - expired :]
+
         if not self.chain:
             msg = "Empty chain"
             raise ValueError(msg)
 
         self.curr = self.chain.pop()
-        self.universe = [self.curr]
+        self.universe = (self.curr,)
         self.maturity = self.curr.maturity
 
 
@@ -105,34 +125,74 @@ class Vertice(Pipeline):
 
     def init(self):
         self.build_chain()
+        self.roll_dates = np.array(
+            [
+                date(
+                    asset.maturity.year,
+                    self._DEFAULT_RATESMONTH,
+                    self._DEFAULT_RATESDAY,
+                ).toordinal()
+                for asset in self.chain
+            ]
+        )
         self.curr = self.chain[-1]
         self.ref_year = self.curr.maturity.year
+        self.__roll_date = date(
+            self.ref_year,
+            self._DEFAULT_RATESMONTH,
+            self._DEFAULT_RATESDAY,
+        )
 
     def next(self) -> Sequence[Asset]:
 
-        while self.get_lagged_date() > self.roll_date:
-            self.broker.close(self.curr)
-            self.apply_roll()
+        lagged = self.get_lagged_date()
+
+        if lagged > self.roll_date:
+            for asset in reversed(self.apply_roll(lagged)):
+                self.broker.close(asset)
+
+        return tuple(self.chain)
+
+    def apply_roll(self, lagged: Optional[date] = None) -> List[Asset]:
+        """
+        Drops the current contract out of the chain. When `lagged` 
+        is given, every contract whose roll date has already passed 
+        by then is dropped at once, through a binary search on the 
+        roll dates of the (descending) chain. Returns the dropped
+        contracts, so that `next` may close them.
+        """
+
+        if not self.chain:
+            msg = "Empty chain"
+            raise ValueError(msg)
+
+        size, expired = len(self.chain), 1
+
+        if lagged is not None:
+            ascending = self.roll_dates[size - 1 :: -1]
+            expired = np.searchsorted(ascending, lagged.toordinal())
 
-        return self.chain
+        dropped = self.chain[size - expired :]
+        del self.chain[size - expired :]
 
-    def apply_roll(self):
         if not self.chain:
             msg = "Empty chain"
             raise ValueError(msg)
 
-        self.chain.pop()
         self.curr = self.chain[-1]
         self.ref_year = self.curr.maturity.year
-
-    @property
-    def roll_date(self) -> date:
-        return date(
+        self.__roll_date = date(
             self.ref_year,
             self._DEFAULT_RATESMONTH,
             self._DEFAULT_RATESDAY,
         )
 
+        return dropped
+
+    @property
+    def roll_date(self) -> date:
+        return self.__roll_date
+
 
 class Ranking(Pipeline):
 
@@ -168,7 +228,7 @@ class Ranking(Pipeline):
     ticker to be well behaved enough to represent two stocks of the same
     company as having the same initial four letters, as it is common in
     the brazilian market (if this hypothesis does not hold, changes need
-    to be implemented in this function!) - e.g. PETR3 and PETR4 will be
+    to be implemented in `Asset.prefix`!) - e.g. PETR3 and PETR4 will be
     considered stocks belonging to the same company, thus just the best 
     ranked one will be select.  
     
@@ -194,51 +254,59 @@ class Ranking(Pipeline):
     """
 
     def init(self, n: Optional[int] = None):
-        self.universe = []
+        self.universe = ()
         self.n = n
         if self.n is None:
             self.n = self._DEFAULT_N
 
+        assets = self.assets.values()
+        self.inceptions = np.array([asset.inception.toordinal() for asset in assets])
+        self.maturities = np.array([asset.maturity.toordinal() for asset in assets])
+
     def next(self) -> Sequence[Asset]:
 
         if self.date.weekday() > self.get_lagged_date(lag=1).weekday():
 
-            self.actives = {
-                asset.ticker: asset
-                for asset in self.assets.values()
-                if asset.inception <= self.date
-                and asset.maturity >= self.date
-                and asset.liquidity[0] > self._DEFAULT_LIQTHRESH
-                and asset.volatility[0] < self._DEFAULT_STKMAXVOL
-                and asset.volatility[0] > self._DEFAULT_STKMINVOL
-            }
-
-            self.rank = sorted(
-                [
-                    (asset.ticker, asset.indicator[0])
-                    for asset in self.actives.values()
-                    if not np.isnan(asset.indicator[0])
-                ],
-                key=lambda x: x[1],
-            )
+            today, liqthresh = self.date.toordinal(), self._DEFAULT_LIQTHRESH
+            minvol, maxvol = self._DEFAULT_STKMINVOL, self._DEFAULT_STKMAXVOL
+            alive = (self.inceptions <= today) & (self.maturities >= today)
+
+            self.actives = {}
+            for asset in compress(self.assets.values(), alive):
+                if not asset.liquidity[0] > liqthresh:
+                    continue
+                vol = asset.volatility[0]
+                if minvol < vol < maxvol:
+                    self.actives[asset.ticker] = asset
+
+            rank = []
+            for asset in self.actives.values():
+                ind = asset.indicator[0]
+                if not np.isnan(ind):
+                    rank.append((asset.ticker, ind))
+
+            self.rank = sorted(rank, key=lambda x: x[1])
 
             unv, names = [], []
-            tmp = [x[0] for x in self.rank]
 
-            while len(unv) < self.n and tmp:
-                ticker = tmp.pop()
-                name = ticker[:4]
+            for ticker, _ in reversed(self.rank):
+                if len(unv) >= self.n:
+                    break
+
+                asset = self.assets[ticker]
+                name = asset.prefix
                 self.tk = ticker
 
                 if name not in names:
                     names.append(name)
-                    unv.append(self.assets[ticker])
+                    unv.append(asset)
 
+            selected = {id(asset) for asset in unv}
             for asset in self.universe:
-                if asset not in unv:
+                if id(asset) not in selected:
                     self.broker.close(asset)
 
-            self.universe = unv.copy()
+            self.universe = tuple(unv)
 
         return self.universe
 
@@ -271,51 +339,67 @@ class VA_Ranking(Pipeline):
     """
 
     def init(self, n: Optional[int] = None):
-        self.universe = []
+        self.universe = ()
         self.n = n
         if self.n is None:
             self.n = self._DEFAULT_N
 
+        assets = self.assets.values()
+        self.inceptions = np.array([asset.inception.toordinal() for asset in assets])
+        self.maturities = np.array([asset.maturity.toordinal() for asset in assets])
+
     def next(self) -> Sequence[Asset]:
 
         if self.date.weekday() > self.get_lagged_date(lag=1).weekday():
 
-            self.actives = {
-                asset.ticker: asset
-                for asset in self.assets.values()
-                if asset.inception <= self.date
-                and asset.maturity >= self.date
-                and asset.liquidity[0] > self._DEFAULT_LIQTHRESH
-                and asset.volatility[0] < self._DEFAULT_STKMAXVOL
-                and asset.volatility[0] > self._DEFAULT_STKMINVOL
-            }
-
-            self.rank = sorted(
-                [
-                    (asset.ticker, asset.indicator[0], asset.volatility[0])
-                    for asset in self.actives.values()
-                    if not np.isnan(asset.indicator[0])
-                ],
-                key=lambda x: x[1] / x[2],
+            today, liqthresh = self.date.toordinal(), self._DEFAULT_LIQTHRESH
+            minvol, maxvol = self._DEFAULT_STKMINVOL, self._DEFAULT_STKMAXVOL
+            alive = (self.inceptions <= today) & (self.maturities >= today)
+
+            self.actives, vols = {}, []
+            for asset in compress(self.assets.values(), alive):
+                if not asset.liquidity[0] > liqthresh:
+                    continue
+                vol = asset.volatility[0]
+                if minvol < vol < maxvol:
+                    self.actives[asset.ticker] = asset
+                    vols.append(vol)
+
+            count = len(self.actives)
+            tickers = np.array(tuple(self.actives), dtype=object)
+            ind = np.fromiter(
+                (asset.indicator[0] for asset in self.actives.values()),
+                dtype=float,
+                count=count,
             )
+            vol = np.array(vols, dtype=float)
+
+            mask = ~np.isnan(ind)
+            tickers, score = tickers[mask], ind[mask] / vol[mask]
+            order = np.argsort(score, kind="stable")
+
+            self.rank = list(zip(tickers[order], score[order]))
 
             unv, names = [], []
-            tmp = [x[0] for x in self.rank]
 
-            while len(unv) < self.n and tmp:
-                ticker = tmp.pop()
-                name = ticker[:4]
+            for ticker, _ in reversed(self.rank):
+                if len(unv) >= self.n:
+                    break
+
+                asset = self.assets[ticker]
+                name = asset.prefix
                 self.tk = ticker
 
                 if name not in names:
                     names.append(name)
-                    unv.append(self.assets[ticker])
+                    unv.append(asset)
 
+            selected = {id(asset) for asset in unv}
             for asset in self.universe:
-                if asset not in unv:
+                if id(asset) not in selected:
                     self.broker.close(asset)
 
-            self.universe = unv.copy()
+            self.universe = tuple(unv)
 
         return self.universe
 
@@ -371,11 +455,13 @@ class Portfolio(Pipeline):
     """
 
     def init(self):
-        self.universe = []
+        self.universe = ()
 
     def next(self) -> Sequence[Asset]:
-        self.universe = [
+        self.universe = tuple(
             asset for asset in self.assets.values()
             if asset.inception <= self.date
             and asset.maturity >= self.date
-        ]
+        )
+
+        return self.universe
@@ -32,6 +32,8 @@ class Position:
         self.__data = data
         self.__stop = stop
         self.__size = size
+        self.__expo = None
+        self.__expo_buffer = None
 
     def __repr__(self):
 
@@ -49,6 +51,7 @@ class Position:
             raise TypeError()
         
         self.__size+=delta     
+        self.__expo_buffer = None
 
     @property
     def data(self) -> Asset:
@@ -69,3 +72,20 @@ class Position:
     @property
     def size(self) -> float:
         return self.__size
+
+    @property
+    def expo(self) -> float:
+        """
+        `Exposition Property`
+
+        Position notional, in the asset's own currency,
+        referenced @ CLOSE. It is memoized for the current
+        bar and reset whenever the position size changes.
+        """
+        buffer = self.__data.buffer
+        if not buffer == self.__expo_buffer:
+            data = self.__data
+            self.__expo = self.__size * data.multiplier * data.close[0]
+            self.__expo_buffer = buffer
+
+        return self.__expo
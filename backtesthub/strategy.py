@@ -4,9 +4,9 @@ import math
 import numpy as np
 import pandas as pd
 from numbers import Number
-from abc import ABCMeta, abstractmethod
+from itertools import compress
 from collections import OrderedDict, defaultdict as ddict
-from typing import Callable, Dict, Union, Optional, Sequence
+from typing import Callable, Dict, Union, Optional, Sequence, Set
 
 from .broker import Broker
 from .pipeline import Pipeline
@@ -14,15 +14,15 @@ from .utils.math import EWMA_volatility
 from .utils.bases import Line, Base, Asset
 from .utils.config import (
     _DEFAULT_MIN_SIZE,
-    _DEFAULT_CURRENCY,
     _DEFAULT_SIZING,
     _DEFAULT_THRESH,
     _MIN_VOL,
     _METHOD,
+    Method,
 )
 
 
-class Strategy(metaclass=ABCMeta):
+class Strategy:
     """
     `Strategy Class`
 
@@ -41,6 +41,20 @@ class Strategy(metaclass=ABCMeta):
     etc. and enables a channel to send orders) 
     """
 
+    __slots__ = (
+        "__broker",
+        "__get_position",
+        "__pipeline",
+        "__bases",
+        "__assets",
+        "__target",
+        "__params",
+        "__warned",
+        "__method",
+        "__texpo",
+        "__batch_texpo",
+    )
+
     def __init__(
         self,
         broker: Broker,
@@ -51,20 +65,31 @@ class Strategy(metaclass=ABCMeta):
     ):
 
         self.__broker = broker
+        self.__get_position = broker.get_position
         self.__pipeline = pipeline
         self.__bases = bases
         self.__assets = assets
         self.__target = target
         self.__params = None
 
-    @abstractmethod
-    def init():
+        self.__warned: Set[str] = set()
+        self.__method = _METHOD.get(_DEFAULT_SIZING)
+        self.__texpo = {
+            Method.EWMA: self.__ewma_texpo,
+            Method.EXPO: self.__expo_texpo,
+        }
+        self.__batch_texpo = {
+            Method.EWMA: self.__ewma_batch_texpo,
+            Method.EXPO: self.__expo_texpo,
+        }
+
+    def init(self):
         """
         `Strategy Initialization`
 
-        Since this is an abstract method, it 
-        is expected to be overriden by another 
-        method belonging to a child class.
+        This method is expected to be overriden 
+        by another method belonging to a child 
+        class.
 
         This child class' init method will be 
         responsible for setting up the initial 
@@ -76,15 +101,14 @@ class Strategy(metaclass=ABCMeta):
         3) Universe Initialization
         4) Parameters Setting
         """
+        raise NotImplementedError()
 
-    @abstractmethod
-    def next():
+    def next(self):
         """ 
         `Strategy Running`
 
-        Since this is an abstract method, it is expected 
-        to be overriden by another method belonging to a 
-        child class.
+        This method is expected to be overriden by another 
+        method belonging to a child class.
 
         This child class' next method will be responsible 
         for carrying on all steps necessary for strategy 
@@ -112,6 +136,7 @@ class Strategy(metaclass=ABCMeta):
         for new/current trading, it is not responsible for closing 
         positions that no longer remains in the universe, though.
         """
+        raise NotImplementedError()
 
     def I(
         self,
@@ -135,10 +160,7 @@ class Strategy(metaclass=ABCMeta):
         result containing only numbers
         """
 
-        try:
-            ind = func(data, *kwargs.values())
-        except Exception as e:
-            raise Exception(e)
+        ind = func(data, *kwargs.values())
 
         if not len(data) == len(ind):
             msg = f"Line length not compatible"
@@ -159,10 +181,7 @@ class Strategy(metaclass=ABCMeta):
         but it is applied to volatility calcs.
         """
         
-        try:
-            vol = func(data, *kwargs.values())
-        except Exception as e:
-            raise Exception(e)
+        vol = func(data, *kwargs.values())
 
         return pd.Series(vol)
 
@@ -187,18 +206,19 @@ class Strategy(metaclass=ABCMeta):
         """
         default = ["signal", "volatility"]
 
-        base_lines = list(base.lines)
-        new_lines = lines or default
+        base_lines = set(base.lines)
+        new_lines = [line.lower() for line in lines or default]
+        new_lines = {
+            line: getattr(base, line)
+            for line in new_lines
+            if line in base_lines
+        }
 
+        ## each asset needs its own Line (buffers are per Data)
         for asset in assets.values():
-            for line in new_lines:
-                line = line.lower()
-                if not line in base_lines:
-                    continue
-                obj = eval(f"base.{line}")
-
+            for name, obj in new_lines.items():
                 asset.add_line(
-                    name=line,
+                    name=name,
                     line=Line(obj),
                 )
 
@@ -226,7 +246,39 @@ class Strategy(metaclass=ABCMeta):
         number to parameter `texpo`.
         """
 
-        if method not in _METHOD:
+        method = self.__get_method(method, min_size)
+
+        factor = self.__get_factor(data)
+        signal = data.get_value("signal")
+        price = data.get_value("close") * factor
+        equity = self.__broker.last_equity
+
+        if math.isnan(price):
+            self.__warn_incomplete(data)
+            return 0
+
+        texpo = self.__texpo[method](data, texpo)
+        size = signal * texpo * equity / price
+
+        if not math.isfinite(size):
+            txt=f"Error found while sizing {data}"
+            raise ValueError(txt) 
+
+        ## rounds towards zero, to a multiple of min_size
+        return min_size * math.trunc(size / min_size)
+
+    def __get_method(self, method: str, min_size: int) -> Method:
+        """
+        Resolves the sizing method, validating
+        it along with `min_size`. The default
+        method is pre-resolved at __init__.
+        """
+        if method == _DEFAULT_SIZING:
+            method = self.__method
+        else:
+            method = _METHOD.get(method)
+
+        if method is None:
             msg = "Method not implemented"
             raise ValueError(msg)
 
@@ -234,44 +286,129 @@ class Strategy(metaclass=ABCMeta):
             msg = "Invalid min_size, must be int >=1"
             raise ValueError(msg)
 
-        method = _METHOD[method]
+        return method
+
+    def __warn_incomplete(self, data: Asset):
+        """
+        Warns about incomplete data only the
+        first time it is found for an asset.
+        """
+        if data.ticker in self.__warned:
+            return
+
+        self.__warned.add(data.ticker)
+        print(f"Data Warn!, {data} is incomplete !!")
+
+    def __get_factor(self, data: Asset) -> Number:
+        """
+        Contract multiplier converted @ CLOSE
+        to `_DEFAULT_CURRENCY`, through the FX
+        line resolved by `Broker.get_fx`.
+        """
         factor = data.multiplier
-        curr = data.currency
-        if not curr == _DEFAULT_CURRENCY:
-            pair = f"{curr}{_DEFAULT_CURRENCY}"
-            factor *= self.__broker.currs[pair].close[0]
+        fx = self.__broker.get_fx(data)
+        if fx is not None:
+            factor *= fx[0]
 
-        signal = data.signal[0]
-        price = data.close[0] * factor
-        equity = self.__broker.last_equity
+        return factor
 
-        if np.isnan(price):
-            print(f"Data Warn!, {data} is incomplete !!")
-            return 0
+    def __ewma_texpo(
+        self,
+        data: Asset,
+        texpo: Optional[float] = None,
+    ) -> float:
+        """
+        Inverse volatility target exposition,
+        volatility floored by `_MIN_VOL` if set.
+        """
+        vol_asset = data.get_value("volatility")
+        if data.asset in _MIN_VOL:
+            min_vol = _MIN_VOL[data.asset]
+            vol_asset = max(vol_asset, min_vol)
 
-        if method == _METHOD["EWMA"]:
-            vol_target = self.__target
-            vol_asset = data.volatility[0]
-            if data.asset in _MIN_VOL:
-                min_vol = _MIN_VOL[data.asset]
-                vol_asset = max(vol_asset, min_vol)
-            texpo = vol_target / vol_asset
+        return self.__target / vol_asset
 
-        elif method == _METHOD["EXPO"]:
-            assert texpo is not None
+    def __expo_texpo(
+        self,
+        data: Asset,
+        texpo: Optional[float] = None,
+    ) -> float:
+        """
+        User given target exposition.
+        """
+        assert texpo is not None
 
-        size = signal * texpo * equity / price
+        return texpo
 
-        if np.isnan(size):
-            txt=f"Error found while sizing {data}"
-            raise ValueError(txt) 
+    def __ewma_batch_texpo(
+        self,
+        assets: Sequence[Asset],
+        texpo: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized `__ewma_texpo`, one
+        target exposition per asset.
+        """
+        count = len(assets)
+        vol_asset = np.fromiter(
+            (data.get_value("volatility") for data in assets),
+            dtype=float,
+            count=count,
+        )
+        min_vol = np.fromiter(
+            (_MIN_VOL.get(data.asset, -np.inf) for data in assets),
+            dtype=float,
+            count=count,
+        )
+
+        return self.__target / np.maximum(vol_asset, min_vol)
+
+    def sizing_batch(
+        self,
+        assets: Sequence[Asset],
+        texpo: Optional[float] = None,
+        method: str = _DEFAULT_SIZING,
+        min_size: int = _DEFAULT_MIN_SIZE,
+    ) -> np.ndarray:
+
+        """
+        `Batch Order Sizer Method`
+
+        Vectorized counterpart of `sizing`, which
+        gathers the current state of every asset
+        given and sizes them all at once, returning
+        an array of sizes in the same order.
 
-        if size > 0:
-            size = min_size * math.floor(size / min_size)
-        elif size < 0:
-            size = min_size * math.ceil(size / min_size)
+        Each entry matches what `sizing` would have
+        returned for that asset alone, so strategies
+        that size their whole universe every period
+        may just loop over the result to issue orders.
+        """
+
+        method = self.__get_method(method, min_size)
+
+        count = len(assets)
+        signal, price = np.empty(count), np.empty(count)
+
+        for i, data in enumerate(assets):
+            signal[i] = data.get_value("signal")
+            price[i] = data.get_value("close") * self.__get_factor(data)
 
-        return size
+        incomplete = np.isnan(price)
+        for data in compress(assets, incomplete):
+            self.__warn_incomplete(data)
+
+        texpo = self.__batch_texpo[method](assets, texpo)
+        size = signal * texpo * self.__broker.last_equity / price
+        size[incomplete] = 0
+
+        invalid = ~np.isfinite(size)
+        if invalid.any():
+            txt = f"Error found while sizing {assets[invalid.argmax()]}"
+            raise ValueError(txt)
+
+        ## rounds towards zero, to a multiple of min_size
+        return min_size * np.trunc(size / min_size)
 
     def order(
         self,
@@ -303,29 +440,66 @@ class Strategy(metaclass=ABCMeta):
         ordered dictionary.
         """
         
+        if size is None:
+            return
+
         if data is None:
             data = self.asset
 
-        position = self.__broker.get_position(data.ticker)
+        position = self.__get_position(data.ticker)
         current = position.size if position is not None else 0
 
-        if size is None:
+        if current and thresh > 0 and size * size < (thresh * current) ** 2:
             return
 
-        has_position = not current == 0
-        has_tresh = thresh > 0
-
-        if has_position and has_tresh:
-            stimulus = abs(size) / abs(current)
-            if stimulus < thresh:
-                return
-
         self.__broker.new_order(
             data=data,
             size=size,
             limit=limit,
         )
 
+    def order_batch(
+        self,
+        assets: Sequence[Asset],
+        sizes: Sequence[Number],
+        thresh: float = _DEFAULT_THRESH,
+        limit: Optional[float] = None,
+        stop: Optional[float] = None,
+    ):
+        """
+        `Batch Order Method`
+
+        Vectorized counterpart of `order`, which takes
+        a sequence of assets and their respective order
+        sizes (e.g. the output of `sizing_batch`), checks
+        all of them against the current positions at once
+        and only then issues to Broker the orders that pass 
+        the same threshold rule applied by `order`.
+
+        Limit and Stop orders are still not available.
+        """
+
+        broker, get_position = self.__broker, self.__get_position
+        count = len(assets)
+        sizes = np.asarray(sizes, dtype=float)
+        current = np.zeros(count)
+
+        for i, data in enumerate(assets):
+            position = get_position(data.ticker)
+            if position is not None:
+                current[i] = position.size
+
+        valid = np.ones(count, dtype=bool)
+
+        if thresh > 0:
+            valid &= ~((current != 0) & (sizes * sizes < (thresh * current) ** 2))
+
+        broker.new_orders(
+            datas=compress(assets, valid),
+            sizes=sizes[valid],
+            limit=limit,
+        )
+
     def order_target(
         self,
         data: Optional[Asset] = None,
@@ -354,31 +528,68 @@ class Strategy(metaclass=ABCMeta):
 
         """
 
+        if target is None:
+            return
+
         if data is None:
             data = self.asset
 
-        position = self.__broker.get_position(data.ticker)
+        position = self.__get_position(data.ticker)
         current = position.size if position is not None else 0
+        delta = target - current
 
-        if target is None:
+        if not delta:
             return
 
-        if target == current:
+        if current and thresh > 0 and delta * delta < (thresh * current) ** 2:
             return
 
-        has_position = not current == 0
-        has_tresh = thresh > 0
+        self.__broker.new_order(
+            data=data,
+            size=delta,
+            limit=limit,
+        )
+
+    def order_target_batch(
+        self,
+        assets: Sequence[Asset],
+        targets: Sequence[Number],
+        thresh: float = _DEFAULT_THRESH,
+        limit: Optional[float] = None,
+        stop: Optional[float] = None,
+    ):
+        """
+        `Batch Order Target Method`
+
+        Vectorized counterpart of `order_target`, which
+        takes a sequence of assets and their respective
+        target positions (e.g. the output of `sizing_batch`),
+        computes every order size at once and only then
+        issues to Broker the orders that pass the same
+        threshold rule applied by `order_target`.
+
+        Limit and Stop orders are still not available.
+        """
+
+        broker, get_position = self.__broker, self.__get_position
+        count = len(assets)
+        target = np.asarray(targets, dtype=float)
+        current = np.zeros(count)
+
+        for i, data in enumerate(assets):
+            position = get_position(data.ticker)
+            if position is not None:
+                current[i] = position.size
 
         delta = target - current
+        valid = delta != 0
 
-        if has_position and has_tresh:
-            stimulus = abs(delta) / abs(current)
-            if stimulus < thresh:
-                return
+        if thresh > 0:
+            valid &= ~((current != 0) & (delta * delta < (thresh * current) ** 2))
 
-        self.__broker.new_order(
-            data=data,
-            size=delta,
+        broker.new_orders(
+            datas=compress(assets, valid),
+            sizes=delta[valid],
             limit=limit,
         )
 
@@ -415,11 +626,11 @@ class Strategy(metaclass=ABCMeta):
 
     @property
     def base(self) -> Base:
-        return tuple(self.__bases.values())[0]
+        return next(iter(self.__bases.values()))
 
     @property
     def hbase(self) -> Base:
-        return tuple(self.__bases.values())[-1]
+        return next(reversed(self.__bases.values()))
 
     @property
     def bases(self) -> Dict[str, Base]:
@@ -427,7 +638,7 @@ class Strategy(metaclass=ABCMeta):
 
     @property
     def asset(self) -> Asset:
-        return tuple(self.__assets.values())[0]
+        return next(iter(self.__assets.values()))
 
     @property
     def assets(self) -> Dict[str, Asset]:
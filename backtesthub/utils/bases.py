@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 from datetime import date
 from numbers import Number
-from typing import Optional, Sequence, Union
+from typing import List, Optional, Sequence, Union
 
 from .checks import derive_asset
 from .config import (
@@ -17,7 +17,7 @@ from .config import (
     _DEFAULT_MATURITY,
     _COMMTYPE,
     _RATESLIKE,
-    _CURR,
+    _CURRSET,
 )
 
 
@@ -65,39 +65,48 @@ class Line(np.ndarray):
     NOTE: method "self.next()" controls the current state of buffer, 
     and is directly controlled by the event loop at backtesthub.backtest 
     main function, in order to maintain synchonism at all lines held by 
-    every data object.
+    every data object. Lines held by a `Data` object share its buffer
+    cell (see `Line.bind`), so the whole data advances in a single step.
 
     """
 
+    __slots__ = ("__array", "__len", "__buffer", "__series")
+
     def __new__(
         cls,
         array: Union[Sequence, pd.Series, np.ndarray],
         buffer: int = _DEFAULT_BUFFER,
     ):
-        arr = np.asarray(array)
+        if type(array) is np.ndarray:
+            arr = array
+        else:
+            arr = np.asarray(array)
 
         obj = arr.view(cls)
         obj.__array = arr
         obj.__len = len(arr)
-        obj.__buffer = buffer
+        obj.__buffer = [buffer]
+        obj.__series = None
 
         return obj
 
     def __getitem__(self, key: int):
-        key += self.__buffer
-        return super().__getitem__(key)
+        return self.__array[key + self.__buffer[0]]
 
     def __repr__(self):
         beg = _DEFAULT_BUFFER
-        end = self.__buffer
+        end = self.__buffer[0]
         return repr(self.__array[beg: end + 1])
 
     def next(self):
-        self.__buffer += 1
+        self.__buffer[0] += 1
+
+    def bind(self, buffer: List[int]):
+        self.__buffer = buffer
 
     @property
     def buffer(self) -> int:
-        return self.__buffer
+        return self.__buffer[0]
 
     @property
     def array(self) -> Sequence:
@@ -105,8 +114,10 @@ class Line(np.ndarray):
 
     @property
     def series(self) -> pd.Series:
-        idx = np.arange(len(self))
-        return pd.Series(self.array, idx)
+        if self.__series is None:
+            idx = np.arange(len(self))
+            self.__series = pd.Series(self.array, idx)
+        return self.__series.copy(deep=False)
 
 
 class Data:
@@ -149,8 +160,23 @@ class Data:
     cleansing utils functions (e.g. func fill_OHLC takes an OHLC 
     schemed dataframe an fill np.nan values with appropriate data)
 
+    NOTE: Hot loops may use `data.get_value(line, k)` and `data.get_window(
+    line, n)`, which index the plain arrays behind each line with the data
+    buffer, sparing the `Line.__getitem__` dispatch (e.g. `data.get_value(
+    "close", -1)` equals `data.close[-1]`).
+
     """
 
+    __slots__ = (
+        "__lines",
+        "__arrays",
+        "__names",
+        "__buffer",
+        "__matrix",
+        "__schema",
+        "__df",
+    )
+
     def __init__(
         self,
         data: pd.DataFrame,
@@ -165,13 +191,19 @@ class Data:
             raise ValueError(msg)
 
         if index is not None:
-            data = data.reindex(
-                index=index,
-                method="ffill",
-            )
-            data = data.sort_index(
-                ascending=True,
-            )
+            ## frames already on the calendar index (e.g. shared
+            ## across assets) don't need the ffill hash-join copy
+            if not (len(data) == len(index) and data.index.equals(pd.Index(index))):
+                data = data.reindex(
+                    index=index,
+                    method="ffill",
+                )
+            else:
+                data = data.copy()
+            if not data.index.is_monotonic_increasing:
+                data = data.sort_index(
+                    ascending=True,
+                )
 
         else:
             index_type = data.index.inferred_type
@@ -183,35 +215,105 @@ class Data:
                 msg = "Index must be `date` or `datetime`"
                 raise TypeError(msg)
 
-            data = data.sort_index(
-                ascending=True,
-            )
-            index = tuple(data.index)
+            if not data.index.is_monotonic_increasing:
+                data = data.sort_index(
+                    ascending=True,
+                )
+            else:
+                data = data.copy()
+            index = data.index.to_numpy()
+
+        ## homogeneous frames are held as a single (column x row) matrix,
+        ## whose rows back each line as contiguous views. `data` is owned
+        ## here (reindexed, sorted or copied above), so its single block
+        ## is aliased rather than copied again
+        if data.dtypes.nunique() == 1:
+            matrix = np.ascontiguousarray(data.to_numpy().T)
+            arrays = iter(matrix)
+        else:
+            matrix = None
+            arrays = (arr for _, arr in data.items())
 
-        self.__lines = {l.lower(): Line(arr) for l, arr in data.items()}
+        self.__lines = {l.lower(): Line(arr) for l, arr in zip(data.columns, arrays)}
         self.__lines["__index"] = Line(array=index)
-        self.__buffer = _DEFAULT_BUFFER
+        self.__buffer = [_DEFAULT_BUFFER]
+        for line in self.__lines.values():
+            line.bind(self.__buffer)
+        self.__arrays = {k: v.array for k, v in self.__lines.items()}
+        self.__names = tuple(l for l in self.__lines if not l.startswith("__"))
+        self.__matrix = matrix
+        self.__schema = tuple(col.lower() for col in data.columns)
         self.__df = data
 
     def __repr__(self):
-        dct = {k: v for k, v in self.__df.iloc[self.__buffer].items()}
-        lines = ", ".join("{}={:.2f}".format(k, v) for k, v in dct.items())
+        if self.__matrix is not None:
+            row = self.__matrix[:, self.__buffer[0]]
+            items = zip(self.__df.columns, row)
+        else:
+            items = self.__df.iloc[self.__buffer[0]].items()
+        lines = ", ".join("{}={:.2f}".format(k, v) for k, v in items)
 
         return f"<{self.__class__.__name__} {self.ticker} ({self.date}) {lines}>"
 
     def __getitem__(self, line: str):
-        return self.__lines.get(line.lower())
+        ## canonical (already lower-cased) names hit directly,
+        ## lowering is only paid by mixed-case references
+        obj = self.__lines.get(line)
+        if obj is None:
+            obj = self.__lines.get(line.lower())
+        return obj
 
     def __getattr__(self, line: str):
-        return self.__lines.get(line.lower())
+        ## private/dunder misses (e.g. numpy or copy protocol
+        ## probes) are never lines, skip the lookup altogether
+        if line.startswith("_"):
+            raise AttributeError(line)
+
+        obj = self.__lines.get(line)
+        if obj is None:
+            obj = self.__lines.get(line.lower())
+        return obj
 
     def __len__(self):
         return len(self.__df)
 
+    def __contains__(self, line: str):
+        line = line.lower()
+        return line in self.__lines and not line.startswith("__")
+
     def next(self):
-        self.__buffer += 1
-        for line in self.__lines:
-            self.__lines[line].next()
+        self.__buffer[0] += 1
+
+    def get_value(self, line: str, k: int = 0):
+        """
+        Returns the value of `line` "k" periods away from the current
+        one (i.e. same as `data.line[k]`), indexing the plain array
+        behind the line directly. Raises KeyError for unknown lines.
+        """
+
+        arr = self.__arrays.get(line)
+        if arr is None:
+            arr = self.__arrays[line.lower()]
+        return arr[self.__buffer[0] + k]
+
+    def get_window(self, line: str, n: int) -> np.ndarray:
+        """
+        Returns a (zero-copy) view of the last "n" values of `line`, 
+        up to and including the current one. Raises ValueError when
+        "n" is not positive or exceeds the history available at the 
+        current buffer, instead of returning a truncated window.
+        """
+
+        arr = self.__arrays.get(line)
+        if arr is None:
+            arr = self.__arrays[line.lower()]
+        end = self.__buffer[0] + 1
+
+        if not 0 < n <= end:
+            msg = f"Window must be within 1 and {end} periods"
+            raise ValueError(msg)
+
+        return arr[end - n: end]
 
     def add_line(self, name: str, line: Line):
         if not isinstance(line, Line):
@@ -222,9 +324,14 @@ class Data:
             msg = "Line must be of same length of Data"
             raise ValueError(msg)
 
+        line.bind(self.__buffer)
         self.__lines.update(
             {name: line},
         )
+        self.__arrays.update(
+            {name: line.array},
+        )
+        self.__names = tuple(l for l in self.__lines if not l.startswith("__"))
 
     @property
     def index(self) -> Line:
@@ -238,18 +345,21 @@ class Data:
     def df(self) -> pd.DataFrame:
         return self.__df
 
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        return self.__matrix
+
     @property
     def schema(self) -> Sequence[str]:
-        return tuple(col.lower() for col in self.df.columns)
+        return self.__schema
 
     @property
     def buffer(self) -> int:
-        return self.__buffer
+        return self.__buffer[0]
 
     @property
     def lines(self) -> Sequence[str]:
-        lines = self.__lines.keys()
-        return tuple(l for l in lines if not l.startswith("__"))
+        return self.__names
 
 
 class Base(Data):
@@ -289,6 +399,8 @@ class Base(Data):
 
     """
 
+    __slots__ = ("__ticker",)
+
     def __init__(
         self,
         ticker: str,
@@ -347,6 +459,21 @@ class Asset(Base):
        operations such as futures rolling.
     """
 
+    __slots__ = (
+        "__slippage",
+        "__currency",
+        "__inception",
+        "__maturity",
+        "__prefix",
+        "__pair",
+        "__commission",
+        "__commtype",
+        "__multiplier",
+        "__stocklike",
+        "__rateslike",
+        "__asset",
+    )
+
     def __init__(
         self,
         ticker: str,
@@ -376,7 +503,7 @@ class Asset(Base):
             msg = "Invalid value for slippage"
             raise ValueError(msg)
 
-        if currency not in _CURR:
+        if currency not in _CURRSET:
             msg = "Invalid value for currency"
             raise ValueError(msg)
 
@@ -384,6 +511,10 @@ class Asset(Base):
         self.__currency = currency
         self.__inception = inception
         self.__maturity = maturity
+        self.__prefix = self.ticker[:4]
+        self.__pair = None
+        if not currency == _DEFAULT_CURRENCY:
+            self.__pair = currency + _DEFAULT_CURRENCY
 
         if multiplier is None:
             self.__commission = commission or _DEFAULT_SCOMMISSION
@@ -411,6 +542,10 @@ class Asset(Base):
     def asset(self) -> str:
         return self.__asset
 
+    @property
+    def prefix(self) -> str:
+        return self.__prefix
+
     @property
     def multiplier(self) -> Number:
         return self.__multiplier
@@ -419,6 +554,10 @@ class Asset(Base):
     def currency(self) -> str:
         return self.__currency
 
+    @property
+    def pair(self) -> Optional[str]:
+        return self.__pair
+
     @property
     def stocklike(self) -> bool:
         return self.__stocklike
@@ -2,6 +2,7 @@
 
 import os
 import itertools
+from enum import IntEnum
 from datetime import date
 from itertools import product
 
@@ -73,6 +74,10 @@ _CURR = (
     "TRY",
 )
 
+## membership lookups (asset config) use the set,
+## the tuple keeps the ordering _DEFAULT_PAIRS needs
+_CURRSET = frozenset(_CURR)
+
 _DEFAULT_PAIRS = [
     f"{cur1}{cur2}"
     for cur1, cur2 in itertools.product(_CURR, _CURR)
@@ -105,9 +110,14 @@ _COMMTYPE = dict(
     ABS="ABS",
 )
 
+class Method(IntEnum):
+    EXPO = 0
+    EWMA = 1
+
+
 _METHOD = dict(
-    EXPO="EXPO",
-    EWMA="EWMA",
+    EXPO=Method.EXPO,
+    EWMA=Method.EWMA,
 )
 
 _STATUS = dict(
@@ -116,8 +126,10 @@ _STATUS = dict(
     CANC="CANCELLED",
 )
 
-_RATESLIKE = (
-    "DI1",
-    "DAP",
-    "DDI",
+_RATESLIKE = frozenset(
+    (
+        "DI1",
+        "DAP",
+        "DDI",
+    )
 )
\ No newline at end of file
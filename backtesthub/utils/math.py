@@ -30,11 +30,11 @@ def EWMA(
     refer to the function `EWMA_volatility` below.  
     """
 
-    if not type(data) in (Base, Asset):
+    if not isinstance(data, Base):
         msg = "Wrong data type input"
         raise TypeError(msg)
 
-    schema = set(data.schema)
+    schema = data.schema
 
     if "close" not in schema:
         msg = "Close not in Schema"
@@ -64,23 +64,23 @@ def EWMA_volatility(
     
     """
 
-    if not type(data) in (Base, Asset):
+    if not isinstance(data, Base):
         msg = "Wrong data type input"
         raise TypeError(msg)
 
-    schema = set(data.schema)
+    schema = data.schema
 
     if "returns" in schema:
-        returns = data.returns.series
+        returns = np.asarray(data.returns.array, dtype=float)
     elif "close" in schema:
-        returns = data.close.series.pct_change()
+        returns = data.close.series.pct_change().to_numpy()
     else:
         raise ValueError("Close not in Schema")
     
     ## unchanged returns aren't significant
-    returns[returns == 0] = np.nan
+    returns = np.where(returns == 0, np.nan, returns)
 
-    return returns.ewm(alpha=alpha).std() * math.sqrt(252)
+    return pd.Series(returns).ewm(alpha=alpha).std() * math.sqrt(252)
 
 
 def adjust_stocks(data: pd.DataFrame) -> pd.DataFrame:
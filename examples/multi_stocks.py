@@ -101,13 +101,10 @@ class Trend_SMARatio(Strategy):
     def next(self):
         univ = self.get_universe()
 
-        for asset in univ:
-            self.order_target(
-                data=asset,
-                target=self.sizing(
-                    data=asset,
-                )/len(univ),
-            )
+        self.order_target_batch(
+            assets=univ,
+            targets=self.sizing_batch(univ) / len(univ),
+        )
 
 
 class Hedge_Beta(Strategy):
@@ -146,15 +143,14 @@ class Hedge_Beta(Strategy):
         expo = self.get_tbeta()
         texpo = expo / len(univ)
 
-        for hedge in univ:
-            self.order(
-                data=hedge,
-                size=self.sizing(
-                    data=hedge,
-                    texpo=texpo,
-                    method="EXPO",
-                ),
-            )
+        self.order_batch(
+            assets=univ,
+            sizes=self.sizing_batch(
+                assets=univ,
+                texpo=texpo,
+                method="EXPO",
+            ),
+        )
 
 
 ##########################################################
@@ -93,14 +93,15 @@ class Trend_SMACross(Strategy):
 
     def next(self):
         chain = self.get_chain()
-        self.universe = [chain[-v] for v in vertices]
+        self.universe = tuple(chain[-v] for v in vertices)
+        size = len(self.universe)
 
         for asset in self.universe:
             self.order_target(
                 data=asset,
                 target=self.sizing(
                     data=asset,
-                )/len(self.universe),
+                )/size,
             )
 
 ##########################################################